@@ -7,6 +7,48 @@ import os
 import re
 import string
 from threading import Thread
+
+# Precompiled patterns used to build game name suggestions
+PATH_SEPARATOR_RE = re.compile(r'[/\\]')
+CAMEL_CASE_RE = re.compile(r'(?<=[a-z])(?=[A-Z0-9])|(?<=[A-Z])(?=[0-9][^0-9])')
+NUMBER_CASE_RE = re.compile(r'(?<=[0-9])(?=[A-Z])')
+ABBREVIATION_RE = re.compile(r'[A-Z]+[0-9]{0,4}')
+WHITESPACE_RE = re.compile(r'\s+')
+ROMAN_NUMERAL_RE = re.compile(r'IV|IX|V?I{0,3}')
+
+# Files expected in each known RTX-Remix folder layout, in the order they are checked
+REQUIRED_FILES_V1 = frozenset({
+    "build-names.txt", "d3d8_off.dll", "d3d8to9.dll", "d3d9.dll", "dxvk.conf", "dxwrapper.dll", "dxwrapper.ini",
+    "LICENSE.txt", "NvRemixLauncher32.exe", "ThirdPartyLicenses-bridge.txt",
+    "ThirdPartyLicenses-d3d8to9.txt", "ThirdPartyLicenses-dxvk.txt", "ThirdPartyLicenses-dxwrapper.txt", ".trex"
+})
+REQUIRED_FILES_V2 = frozenset({
+    "build_names.txt", "d3d8to9.dll", "d3d9.dll", "dxvk.conf", "LICENSE.txt", "NvRemixLauncher32.exe",
+    "ThirdPartyLicenses-bridge.txt", "ThirdPartyLicenses-d3d8to9.txt", "ThirdPartyLicenses-dxvk.txt", ".trex"
+})
+REQUIRED_FILES_V3 = frozenset({
+    "build_names.txt", "d3d8to9.dll", "d3d9.dll", "LICENSE.txt", "NvRemixLauncher32.exe", "ThirdPartyLicenses-bridge.txt",
+    "ThirdPartyLicenses-d3d8to9.txt", "ThirdPartyLicenses-dxvk.txt", ".trex"
+})
+REQUIRED_FILES_V4 = frozenset({
+    "d3d8to9.dll", "d3d9.dll", "LICENSE.txt", "NvRemixLauncher32.exe", "ThirdPartyLicenses-bridge.txt",
+    "ThirdPartyLicenses-d3d8to9.txt", "ThirdPartyLicenses-dxvk.txt", ".trex"
+})
+
+# Treeview columns and their initial widths
+TREE_COLUMNS = ("🔓", "Game Name", "Folder Path", "Bridge", "Runtime", "dxvk.conf", "d3d8to9.dll", "Runtime Version", "Bridge Version")
+TREE_COLUMN_WIDTHS = {
+    "🔓": 10,
+    "Game Name": 160, "Folder Path": 160,
+    "Bridge": 20, "Runtime": 20, "dxvk.conf": 20, "d3d8to9.dll": 20,
+}
+DEFAULT_COLUMN_WIDTH = 80
+# Column indexes toggled by a click (Bridge, Runtime, dxvk.conf, d3d8to9.dll) and those showing a hand cursor
+TOGGLE_COLUMNS = frozenset({3, 4, 5, 6})
+CLICKABLE_COLUMNS = TOGGLE_COLUMNS | {0}
+
+# Characters accepted in the manual version input fields
+VERSION_CHARS = frozenset(string.digits + string.ascii_letters + ".")
         
 class Tooltip:
     def __init__(self, widget):
@@ -40,7 +82,7 @@ class CustomGameNameDialog(simpledialog.Dialog):
         return self.game_name_var  # initial focus
 
     def generate_options(self):
-        path_elements = filter(None, re.split(r'[/\\]', self.folder_path.replace('_', ' ')))
+        path_elements = filter(None, PATH_SEPARATOR_RE.split(self.folder_path.replace('_', ' ')))
         options = set()
         for pe in path_elements:
             if ':' not in pe and not any(keyword in pe.lower() for keyword in self.exclude_keywords):
@@ -52,8 +94,8 @@ class CustomGameNameDialog(simpledialog.Dialog):
 
     def format_camel_case_and_numbers(self, name):
         # Split only if the number appears to be a year or is clearly separate
-        name_with_spaces = re.sub(r'(?<=[a-z])(?=[A-Z0-9])|(?<=[A-Z])(?=[0-9][^0-9])', ' ', name)
-        name_with_spaces = re.sub(r'(?<=[0-9])(?=[A-Z])', ' ', name_with_spaces)
+        name_with_spaces = CAMEL_CASE_RE.sub(' ', name)
+        name_with_spaces = NUMBER_CASE_RE.sub(' ', name_with_spaces)
         return name_with_spaces
         
     def roman_to_arabic(self, roman):
@@ -70,10 +112,10 @@ class CustomGameNameDialog(simpledialog.Dialog):
         return result
         
     def generate_shortened_name(self, name):
-        if re.fullmatch(r'[A-Z]+[0-9]{0,4}', name) or len(name) <= 4:
+        if ABBREVIATION_RE.fullmatch(name) or len(name) <= 4:
             return {name}
     
-        words = re.split(r'\s+', name.strip())
+        words = WHITESPACE_RE.split(name.strip())
         base_abbr = ''
         shortened_names = set()
     
@@ -87,7 +129,7 @@ class CustomGameNameDialog(simpledialog.Dialog):
                 shortened_names.add(f"{base_abbr}{year_abbr}{year_part_short}")
             elif word.isdigit():
                 base_abbr += word
-            elif re.fullmatch(r'IV|IX|V?I{0,3}', word):  # Regex to identify common Roman numerals
+            elif ROMAN_NUMERAL_RE.fullmatch(word):  # Regex to identify common Roman numerals
                 arabic = self.roman_to_arabic(word)
                 base_abbr += str(arabic)
             else:
@@ -153,18 +195,10 @@ class lazy_rtx_remix_companion:
     def setup_treeview(self):
         """Setup the Treeview with columns, headings, and interaction bindings."""
         # Treeview setup
-        self.tree = ttk.Treeview(self.master, columns=("🔓", "Game Name", "Folder Path", "Bridge", "Runtime", "dxvk.conf", "d3d8to9.dll", "Runtime Version", "Bridge Version"), show="headings")
-        headings = ["🔓", "Game Name", "Folder Path", "Bridge", "Runtime", "dxvk.conf", "d3d8to9.dll", "Runtime Version", "Bridge Version"]
-        for heading in headings:
+        self.tree = ttk.Treeview(self.master, columns=TREE_COLUMNS, show="headings")
+        for heading in TREE_COLUMNS:
             self.tree.heading(heading, text=heading)
-            if heading in ["🔓"]:
-                iwidth = 10
-            elif heading in ["Game Name", "Folder Path"]:
-                iwidth = 160
-            elif heading in ["Bridge", "Runtime", "dxvk.conf", "d3d8to9.dll"]:
-                iwidth = 20
-            else:
-                iwidth = 80
+            iwidth = TREE_COLUMN_WIDTHS.get(heading, DEFAULT_COLUMN_WIDTH)
             self.tree.column(heading, anchor="center", width=iwidth)
         
         # Vertical scrollbar
@@ -236,7 +270,7 @@ class lazy_rtx_remix_companion:
         if row_id and column_id and region == "cell":
             col_index = int(column_id.strip('#')) - 1
             # Change cursor for specific columns
-            if col_index in [0, 3, 4, 5, 6]:
+            if col_index in CLICKABLE_COLUMNS:
                 widget.configure(cursor="hand2")
             else:
                 widget.configure(cursor="arrow")
@@ -276,7 +310,7 @@ class lazy_rtx_remix_companion:
                             widget.item(row_id, values=current_values)
                         self.save_config()
     
-                    elif col_index in [3, 4, 5, 6]:
+                    elif col_index in TOGGLE_COLUMNS:
                         current_value = current_values[col_index]
                         new_value = "No" if current_value == "Yes" else "Yes"
                         current_values[col_index] = new_value
@@ -338,43 +372,26 @@ class lazy_rtx_remix_companion:
             # logging.error(f"Failed to update button state: {e}")
             
     def check_sources(self, folder):
-        required_files_v1 = {
-            "build-names.txt", "d3d8_off.dll", "d3d8to9.dll", "d3d9.dll", "dxvk.conf", "dxwrapper.dll", "dxwrapper.ini",
-            "LICENSE.txt", "NvRemixLauncher32.exe", "ThirdPartyLicenses-bridge.txt",
-            "ThirdPartyLicenses-d3d8to9.txt", "ThirdPartyLicenses-dxvk.txt", "ThirdPartyLicenses-dxwrapper.txt", ".trex"
-        }
-        required_files_v2 = {
-            "build_names.txt", "d3d8to9.dll", "d3d9.dll", "dxvk.conf", "LICENSE.txt", "NvRemixLauncher32.exe",
-            "ThirdPartyLicenses-bridge.txt", "ThirdPartyLicenses-d3d8to9.txt", "ThirdPartyLicenses-dxvk.txt", ".trex"
-        }
-        required_files_v3 = {
-            "build_names.txt", "d3d8to9.dll", "d3d9.dll", "LICENSE.txt", "NvRemixLauncher32.exe", "ThirdPartyLicenses-bridge.txt",
-            "ThirdPartyLicenses-d3d8to9.txt", "ThirdPartyLicenses-dxvk.txt", ".trex"
-        }
-        required_files_v4 = {
-            "d3d8to9.dll", "d3d9.dll", "LICENSE.txt", "NvRemixLauncher32.exe", "ThirdPartyLicenses-bridge.txt",
-            "ThirdPartyLicenses-d3d8to9.txt", "ThirdPartyLicenses-dxvk.txt", ".trex"
-        }
         global oldVersion
         oldVersion = False # Reset the oldVersion flag
         actual_files = set(os.listdir(folder))
-        extra_files = actual_files - required_files_v1
+        extra_files = actual_files - REQUIRED_FILES_V1
         if extra_files:
             oldVersion = True
-            extra_files = actual_files - required_files_v2
+            extra_files = actual_files - REQUIRED_FILES_V2
             if extra_files:
-                extra_files = actual_files - required_files_v3
+                extra_files = actual_files - REQUIRED_FILES_V3
                 if extra_files:
-                    extra_files = actual_files - required_files_v4
+                    extra_files = actual_files - REQUIRED_FILES_V4
                 
-        missing_files = required_files_v1 - actual_files
+        missing_files = REQUIRED_FILES_V1 - actual_files
         if missing_files:
             oldVersion = True
-            missing_files = required_files_v2 - actual_files
+            missing_files = REQUIRED_FILES_V2 - actual_files
             if missing_files:
-                missing_files = required_files_v3 - actual_files
+                missing_files = REQUIRED_FILES_V3 - actual_files
                 if missing_files:
-                    missing_files = required_files_v4 - actual_files
+                    missing_files = REQUIRED_FILES_V4 - actual_files
                     
         return missing_files, extra_files
                     
@@ -417,8 +434,8 @@ class lazy_rtx_remix_companion:
         folder_path = filedialog.askdirectory(title="Select Game Folder")
         if folder_path:
             # Check for .exe files in the selected folder (only in the first level)
-            exe_files = [f for f in os.listdir(folder_path) if f.endswith('.exe')]
-            if not exe_files:
+            has_exe = any(f.endswith('.exe') for f in os.listdir(folder_path))
+            if not has_exe:
                 messagebox.showinfo("No Executable Found", "No executable game file found in the selected folder.")
                 return  # Optionally return if you don't want to proceed
     
@@ -436,8 +453,6 @@ class lazy_rtx_remix_companion:
             self.status_right.config(text="Folder selection was cancelled.")
     
         self.update_copy_button_state()
-        
-    import string
 
     def show_popup_window(self, versions, directory):
         # Create the popup window
@@ -459,8 +474,7 @@ class lazy_rtx_remix_companion:
     
         # Define the validation function
         def validate_input(text):
-            allowed_chars = set(string.digits + string.ascii_letters + ".")
-            return all(char in allowed_chars for char in text)
+            return all(char in VERSION_CHARS for char in text)
     
         # Create the input fields
         runtime_version_label = tk.Label(popup_window, text="Runtime Version:")
@@ -528,24 +542,24 @@ class lazy_rtx_remix_companion:
     
         # Write the lines to the file
         with open(filepath, 'w') as file:
-            file.writelines('\n'.join(lines))
+            file.write('\n'.join(lines))
             
     def load_versions_from_file(self, directory, isSource=False):
         versions = {"runtime version": "N/A", "bridge version": "N/A"}
-        if os.path.exists(os.path.join(directory, "build-names.txt")):
-            filepath = os.path.join(directory, "build-names.txt")
+        legacy_filepath = os.path.join(directory, "build-names.txt")
+        if os.path.exists(legacy_filepath):
+            filepath = legacy_filepath
         else:
             filepath = os.path.join(directory, "build_names.txt")
         try:
             with open(filepath, 'r') as file:
-                lines = file.readlines()
-                for line in lines:
+                for line in file:
                     if "dxvk-remix" in line:
                         versions["runtime version"] = '-'.join(line.strip().split('-')[-3:])
                     elif "bridge-remix" in line:
                         versions["bridge version"] = '-'.join(line.strip().split('-')[-3:])
             return versions
-        except:
+        except (OSError, UnicodeDecodeError):
             if not firstLaunch:
                 if isSource:
                     return self.show_popup_window(versions, directory)
@@ -555,15 +569,17 @@ class lazy_rtx_remix_companion:
     def check_version_and_tag(self, tree_item_id, destination_versions):
         if self.remix_folder:
             current_values = list(self.tree.item(tree_item_id, 'values'))
+            runtime_version = destination_versions["runtime version"]
+            bridge_version = destination_versions["bridge version"]
     
             # Update 'Runtime Version' and 'Bridge Version'
-            current_values[7] = destination_versions["runtime version"]
-            current_values[8] = destination_versions["bridge version"]
+            current_values[7] = runtime_version
+            current_values[8] = bridge_version
             self.tree.item(tree_item_id, values=current_values)
     
             # Check version mismatch and apply tags
-            if (destination_versions["runtime version"] != self.source_versions["runtime version"] or
-                destination_versions["bridge version"] != self.source_versions["bridge version"]):
+            if (runtime_version != self.source_versions["runtime version"] or
+                bridge_version != self.source_versions["bridge version"]):
                 self.tree.item(tree_item_id, tags=("version_mismatch",))
             else:
                 self.tree.item(tree_item_id, tags=("version_match",))
@@ -571,13 +587,17 @@ class lazy_rtx_remix_companion:
             # Update UI
             self.tree.update_idletasks()
 
-    def determine_files_to_copy(self, bridge, runtime, dxvk, d3d8to9):
-        files_to_copy = []
+    def list_remix_folder(self):
         try:
-            items = os.listdir(self.remix_folder)
+            return os.listdir(self.remix_folder)
         except OSError as e:
             self.status_right.config(text=f"Error reading directory {self.remix_folder}: {e}")
-            return files_to_copy  # Return empty list if directory reading fails
+            return []  # Return empty list if directory reading fails
+
+    def determine_files_to_copy(self, items, bridge, runtime, dxvk, d3d8to9):
+        files_to_copy = []
+        if not items:
+            return files_to_copy
     
         if bridge:
             # Exclude specific files unless other conditions include them later
@@ -614,6 +634,10 @@ class lazy_rtx_remix_companion:
             return
     
         self.status_right.config(text=f"Selected items: {selected_items}")
+        # The RTX-Remix folder is the same for every game, list it only once
+        remix_items = self.list_remix_folder()
+        # Games sharing the same file toggles copy the same list of files
+        files_by_selection = {}
         for item in selected_items:
             self.status_right.config(text=f"Selected items: {item}")
             details = self.tree.item(item, 'values')
@@ -625,13 +649,14 @@ class lazy_rtx_remix_companion:
             d3d8to9 = d3d8to9 == 'Yes'
 
             self.status_left.config(text=f"Starting copy for {game_name}...")
-            files_to_copy = self.determine_files_to_copy(bridge, runtime, dxvk, d3d8to9)
+            selection = (bridge, runtime, dxvk, d3d8to9)
+            if selection not in files_by_selection:
+                files_by_selection[selection] = self.determine_files_to_copy(remix_items, *selection)
+            files_to_copy = files_by_selection[selection]
             self.copy_files_threaded(files_to_copy, folder_path, item)
-        if oldVersion:
-            if os.path.exists(os.path.join(folder_path, "build-names.txt")):
-                os.remove(os.path.join(folder_path, "build-names.txt"))
-        elif os.path.exists(os.path.join(folder_path, "build_names.txt")):
-                os.remove(os.path.join(folder_path, "build_names.txt"))
+        build_names = os.path.join(folder_path, "build-names.txt" if oldVersion else "build_names.txt")
+        if os.path.exists(build_names):
+            os.remove(build_names)
             
     def setup_status_bar(self):
         self.status_frame = ttk.Frame(self.master, relief=tk.SUNKEN)
@@ -647,18 +672,22 @@ class lazy_rtx_remix_companion:
         self.progress_bar.pack(side=tk.RIGHT, fill=tk.X)
     
     def copy_files_threaded(self, files_to_copy, folder_path, tree_item):
+        # Bind the source folder once so the worker is not affected if a new one is selected mid-copy
+        remix_folder = self.remix_folder
+
         def thread_target():
             total_files = len(files_to_copy)
             current_file_count = 0
             for source in files_to_copy:
-                full_source_path = os.path.join(self.remix_folder, source)
+                full_source_path = os.path.join(remix_folder, source)
                 if os.path.isdir(full_source_path):
                     for dirpath, dirnames, filenames in os.walk(full_source_path):
+                        # Resolve and create the destination once per directory, not per file
+                        rel_dir = os.path.relpath(dirpath, remix_folder)
+                        dest_dir = os.path.join(folder_path, rel_dir)
+                        if filenames:
+                            os.makedirs(dest_dir, exist_ok=True)
                         for filename in filenames:
-                            rel_dir = os.path.relpath(dirpath, self.remix_folder)
-                            dest_dir = os.path.join(folder_path, rel_dir)
-                            if not os.path.exists(dest_dir):
-                                os.makedirs(dest_dir)
                             src_file = os.path.join(dirpath, filename)
                             dest_file = os.path.join(dest_dir, filename)
                             shutil.copy(src_file, dest_file)
@@ -695,7 +724,7 @@ class lazy_rtx_remix_companion:
             try:
                 self.tree.delete(item)
             except Exception as e:
-                self.status_right.config(text=f"Error deleting item {item}: {str(e)}")
+                self.status_right.config(text=f"Error deleting item {item}: {e}")
 
     def load_config(self):
         """Loads the configuration from a JSON file and updates the UI accordingly."""
@@ -717,7 +746,9 @@ class lazy_rtx_remix_companion:
                 # Final UI updates and status message
                 self.finalize_ui_loading()
                 
-                self.check_sources(self.remix_folder)
+                # Nothing to validate until an RTX-Remix folder has been chosen
+                if self.remix_folder:
+                    self.check_sources(self.remix_folder)
     
         # Handle FileNotFoundError
         except FileNotFoundError:
@@ -729,7 +760,7 @@ class lazy_rtx_remix_companion:
         
         # Handle any other exceptions
         except Exception as e:
-            self.status_right.config(text=f"Error: {str(e)}")
+            self.status_right.config(text=f"Error: {e}")
     
     def update_remix_folder_info(self, config):
         """Updates the remix folder information on the UI."""
@@ -766,8 +797,9 @@ class lazy_rtx_remix_companion:
     
     def apply_window_geometry(self, config):
         """Applies saved window geometry from configuration."""
-        if 'window_geometry' in config:
-            self.master.geometry(config['window_geometry'])
+        window_geometry = config.get('window_geometry')
+        if window_geometry:
+            self.master.geometry(window_geometry)
     
     def finalize_ui_loading(self):
         """Final updates to UI post configuration loading."""
@@ -788,7 +820,7 @@ class lazy_rtx_remix_companion:
                     json.dump(config, config_file, indent=4)
                 self.status_right.config(text="Configuration saved successfully.")
             except Exception as e:
-                self.status_right.config(text=f"Error saving configuration: {str(e)}")
+                self.status_right.config(text=f"Error saving configuration: {e}")
     
     def on_closing(self):
         self.save_config()  # Save the current configuration
@@ -3,6 +3,7 @@
 # Place this script inside the game folder
 
 import os
+import re
 import shutil
 import ctypes
 import tkinter as tk
@@ -53,13 +54,27 @@ dev_mode = False
 merge_Roughusda = False
 diff_file_path = "diff_file.data" 
 newtex_dirctory = 'new_tex'
-excludeFileChar = ['(', ')', '{', '}', '[', ']',':', ';', '~', '=','/','*', ' ']
+excludeFileChar = ('(', ')', '{', '}', '[', ']',':', ';', '~', '=','/','*', ' ')
+hashStripChars = '", \n\t\r'
+matHashPattern = re.compile(r'over "mat_([^"]*)"')
 file_names = []
 
 m_capture_directory = ""
 m_ignoreFilesfromFolder = ""
 changed = False
 
+# config file key -> global variable it is loaded into
+config_keys = {
+    'gamefolder': 'gamefolder',
+    'modfolder': 'modfolder',
+    'capture_directory': 'm_capture_directory',
+    'ignoreListFiles': 'ignoreListFiles',
+    'ignoreFilesfromFolder': 'm_ignoreFilesfromFolder',
+    'modUSDA': 'm_modUSDA',
+    'output_file': 'm_output_file',
+    'newtex_dirctory': 'newtex_dirctory',
+}
+
 set_to_foreground = ctypes.windll.user32.SetForegroundWindow
 keybd_event = ctypes.windll.user32.keybd_event
 
@@ -130,15 +145,11 @@ mat_normal = [
 
 def make_usda(materials):
     global base_data, close_para
-    usda = []
-    for data in base_data:
-        usda.append(data)
+    usda = list(base_data)
     for mat in materials:
         usda.append(mat)
-        for data in materials[mat]:
-            usda.append(data)
-    for data in close_para:
-        usda.append(data)
+        usda.extend(materials[mat])
+    usda.extend(close_para)
     return usda
     
 def make_mat(ddsfiles):
@@ -150,8 +161,7 @@ def make_mat(ddsfiles):
             # no need after remix v0.4.0
             # for data in mat_albedo:
             #    mat[mathash].append(data.replace("{$texture}", file))
-            for data in mat_rough:
-                mat[mathash].append(data)
+            mat[mathash].extend(mat_rough)
     return mat
 
 def merge_usda(new):
@@ -181,17 +191,17 @@ def merge_usda(new):
             origin[hash].append('        }\n')
         i += 1
     diff_data = f'{dirname}/{diff_file_path}'
-    diff_file = []
+    diff_file = set()
     if os.path.exists(diff_data):
         with open(diff_data, "r") as file:
-            diff_file = file.read().split(", ")
+            diff_file = set(file.read().split(", "))
             
     # Compare Captures Texture
     for mat in new:
         try:
             isinstance(origin[mat], list)
         except:
-            hash = mat.replace('        over "mat_', '').replace('"\n', '').rstrip(" ")
+            hash = matHashPattern.search(mat).group(1)
             if hash not in diff_file:
                 diff += hash + ", "
                 newcapture.append(hash)
@@ -243,14 +253,12 @@ def joinRelativePath(path, relativepath):
         
     return path
 
+def cleanHash(line):
+    # drop the quotes, commas and whitespace around a listed hash in one pass
+    return line.strip(hashStripChars)
+
 def validFilename(name):
-    valid = True
-    i = 0
-    while valid and i < len(excludeFileChar):
-        if excludeFileChar[i] in name:
-            valid = False
-        i += 1
-    return valid
+    return not any(c in name for c in excludeFileChar)
 
 def initPath():
     global dirname, gamefolder, modfolder, capture_directory, ignoreListFiles, ignoreFilesfromFolder, modUSDA, output_file, newtex_dirctory
@@ -277,31 +285,30 @@ def loadignorelist():
         with open(ignoreListFiles, "r") as file:
             ignoreFile = file.readlines()
     
-    ignoreFiles = []
+    ignoreFiles = set()
     for line in ignoreFile:
         if validFilename(line):
-            ignoreFiles.append(line.strip('"').strip(',').strip(' ').strip('\n').strip('\t').strip('\r'))
+            ignoreFiles.add(cleanHash(line))
     
     if carpaintHashfromFile != "":
         carMatHash = f'{dirname}/{carpaintHashfromFile}'
         if os.path.exists(carMatHash):
             with open(carMatHash, "r") as file:
                 for line in file:
-                    ignoreFiles.append(line.strip('"').strip(',').strip(' ').strip('\n').strip('\t').strip('\r'))
+                    ignoreFiles.add(cleanHash(line))
                         
     if carWheelHashfromFile != "":
         carMatHash = f'{dirname}/{carWheelHashfromFile}'
         if os.path.exists(carMatHash):
             with open(carMatHash, "r") as file:
                 for line in file:
-                    ignoreFiles.append(line.strip('"').strip(',').strip(' ').strip('\n').strip('\t').strip('\r'))
+                    ignoreFiles.add(cleanHash(line))
 
     if m_ignoreFilesfromFolder != "":
         if os.path.exists(m_ignoreFilesfromFolder):
             for file in os.listdir(m_ignoreFilesfromFolder):
                 if file.endswith('.dds'):
-                    if file.replace('.dds', '') not in ignoreFiles:
-                        ignoreFiles.append(file.replace('.dds', ''))
+                    ignoreFiles.add(file.replace('.dds', ''))
     
     if os.path.exists(m_capture_directory):
         for file in os.listdir(m_capture_directory):
@@ -312,11 +319,13 @@ def loadignorelist():
     if importHashfromFile != "":
         importHashfromFile = f'{dirname}/{importHashfromFile}'
         if os.path.exists(importHashfromFile):
+            known_names = set(file_names)
             with open(importHashfromFile, "r") as file:
                 for line in file:
                     line = line.replace('\n', '')
                     if line not in ignoreFiles:
-                        if line not in file_names:
+                        if line not in known_names:
+                            known_names.add(line)
                             file_names.append(line)
 
 def save():
@@ -327,7 +336,6 @@ def save():
     #     print("Result File saved")
     # except:
     #     print("Failed to save Result file")
-    materials = {}
     materials = make_mat(file_names)
     if merge_Roughusda:
         materials = merge_usda(materials)
@@ -335,8 +343,7 @@ def save():
     
     # Save the lines to another file
     with open('include_list.txt', 'w') as file:
-        for line in file_names:
-            file.write(line + '\n')
+        file.writelines(line + '\n' for line in file_names)
     
     try:
         with open(m_output_file, "w") as file:
@@ -377,33 +384,17 @@ def save():
         
 def validhash(hash):
     global excludeFileChar
-    for c in excludeFileChar:
-        if c in hash:
-            return False
-    return True
+    return not any(c in hash for c in excludeFileChar)
 
 def readConfig():
-    global gamefolder, modfolder, m_capture_directory, ignoreListFiles, m_ignoreFilesfromFolder, m_modUSDA, m_output_file, newtex_dirctory
+    global config_keys
     try:
         with open('lazy_roughess.conf', "r") as file:
             lines = file.readlines()
         for line in lines:
-            if "gamefolder = " in line:
-                gamefolder = line.replace("gamefolder = ", "").strip("\n").strip("\t").strip("\r")
-            elif "modfolder = " in line:
-                modfolder = line.replace("modfolder = ", "").strip("\n").strip("\t").strip("\r")
-            elif "capture_directory = " in line:
-                m_capture_directory = line.replace("capture_directory = ", "").strip("\n").strip("\t").strip("\r")
-            elif "ignoreListFiles = " in line:
-                ignoreListFiles = line.replace("ignoreListFiles = ", "").strip("\n").strip("\t").strip("\r")
-            elif "ignoreFilesfromFolder = " in line:
-                m_ignoreFilesfromFolder = line.replace("ignoreFilesfromFolder = ", "").strip("\n").strip("\t").strip("\r")
-            elif "modUSDA = " in line:
-                m_modUSDA = line.replace("modUSDA = ", "").strip("\n").strip("\t").strip("\r")
-            elif "output_file = " in line:
-                m_output_file = line.replace("output_file = ", "").strip("\n").strip("\t").strip("\r")
-            elif "newtex_dirctory = " in line:
-                newtex_dirctory = line.replace("newtex_dirctory = ", "").strip("\n").strip("\t").strip("\r")
+            key, sep, value = line.partition(" = ")
+            if sep and key in config_keys:
+                globals()[config_keys[key]] = value.strip("\n").strip("\t").strip("\r")
     except:
         print("===========================================================================================")
         print("Failed to read config file")
@@ -519,8 +510,8 @@ def add_carPaint():
             if os.path.exists(carpaintHashfromFile):
                 with open(carpaintHashfromFile, 'r') as file:
                     carPaintHash = file.readlines()
-                    if '\n' not in carPaintHash[len(carPaintHash)-1]:
-                        carPaintHash[len(carPaintHash)-1] = carPaintHash[len(carPaintHash)-1] + '\n'
+                    if '\n' not in carPaintHash[-1]:
+                        carPaintHash[-1] = carPaintHash[-1] + '\n'
                     carPaintHash = set(carPaintHash)
             if clipboardhash not in carPaintHash:
                 carPaintHash.add(clipboardhash)
@@ -540,8 +531,8 @@ def add_carWheel():
             if os.path.exists(carWheelHashfromFile):
                 with open(carWheelHashfromFile, 'r') as file:
                     carWheelHash = file.readlines()
-                    if '\n' not in carWheelHash[len(carWheelHash)-1]:
-                        carWheelHash[len(carWheelHash)-1] = carWheelHash[len(carWheelHash)-1] + '\n'
+                    if '\n' not in carWheelHash[-1]:
+                        carWheelHash[-1] = carWheelHash[-1] + '\n'
                     carWheelHash = set(carWheelHash)
             if clipboardhash not in carWheelHash:
                 carWheelHash.add(clipboardhash)
@@ -561,8 +552,8 @@ def addIgnoreFile():
             if os.path.exists(ignoreListFiles):
                 with open(ignoreListFiles, 'r') as file:
                     ignoreHash = file.readlines()
-                    if '\n' not in ignoreHash[len(ignoreHash)-1]:
-                        ignoreHash[len(ignoreHash)-1] = ignoreHash[len(ignoreHash)-1] + '\n'
+                    if '\n' not in ignoreHash[-1]:
+                        ignoreHash[-1] = ignoreHash[-1] + '\n'
                     ignoreHash = set(ignoreHash)
             if clipboardhash not in ignoreHash:
                 ignoreHash.add(clipboardhash)
@@ -582,8 +573,8 @@ def addRoughFile():
             if os.path.exists(importHashfromFile):
                 with open(importHashfromFile, 'r') as file:
                     importHash = file.readlines()
-                    if '\n' not in importHash[len(importHash)-1]:
-                        importHash[len(importHash)-1] = importHash[len(importHash)-1] + '\n'
+                    if '\n' not in importHash[-1]:
+                        importHash[-1] = importHash[-1] + '\n'
                     importHash = set(importHash)
             if clipboardhash not in importHash:
                 importHash.add(clipboardhash)